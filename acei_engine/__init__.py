@@ -0,0 +1,31 @@
+from acei_engine.models import (
+    ACEIInput,
+    ACEIScore,
+    MitigationInput,
+    RiskCategory,
+    Jurisdiction,
+)
+from acei_engine.compute import (
+    compute_acei,
+    compute_batch,
+    compute_batch_from_dicts,
+    compute_batch_iter,
+    compute_batch_vec,
+    dump_scores,
+)
+from acei_engine.versioning import ACEI_VERSION
+
+__all__ = [
+    "ACEIInput",
+    "ACEIScore",
+    "MitigationInput",
+    "RiskCategory",
+    "Jurisdiction",
+    "compute_acei",
+    "compute_batch",
+    "compute_batch_from_dicts",
+    "compute_batch_iter",
+    "compute_batch_vec",
+    "dump_scores",
+    "ACEI_VERSION",
+]
@@ -0,0 +1,105 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython core for the ACEI scalar pipeline.
+
+Optional accelerator: build in place with
+`python setup.py build_ext --inplace` (requires Cython and a C
+compiler). compute.py falls back to the pure-Python sub-score modules
+when this extension is absent, so deployments without a toolchain are
+unaffected.
+
+All sub-score arithmetic runs on native doubles here; presentation
+rounding stays in the Python wrapper so outputs are bit-identical to
+the fallback path.
+"""
+
+from cython.parallel cimport prange
+from libc.math cimport exp
+
+
+cdef inline double _clamp(double x, double lo, double hi) nogil:
+    if x < lo:
+        return lo
+    if x > hi:
+        return hi
+    return x
+
+
+cpdef (double, double, double, double) compute_subscores(
+    double rs, double fe, double od, double sb,
+    double eh, double rm, double ps, double ir,
+    int dte, double af, double cs,
+    double ci, double mc, double rc, bint has_mit,
+):
+    """Return (impact, likelihood, velocity, mitigation), unrounded."""
+    cdef double impact = _clamp(
+        0.35 * rs + 0.30 * fe + 0.20 * od + 0.15 * sb, 0.0, 10.0
+    )
+    cdef double likelihood = _clamp(
+        0.40 * eh + 0.30 * rm + 0.15 * ps + 0.15 * (10.0 - ir), 0.0, 10.0
+    )
+
+    cdef double time_factor
+    if dte > 0:
+        time_factor = 1.0 / (1.0 + exp((dte - 180.0) / 60.0))
+    else:
+        time_factor = 0.5
+    cdef double velocity = _clamp(
+        0.5 + 2.5 * (0.60 * time_factor + 0.025 * af + 0.015 * cs), 0.5, 3.0
+    )
+
+    cdef double mitigation = 0.0
+    if has_mit:
+        mitigation = _clamp(
+            (0.40 * ci + 0.35 * mc + 0.25 * rc) / 10.0 * 0.5, 0.0, 0.5
+        )
+
+    return impact, likelihood, velocity, mitigation
+
+
+cdef void _acei_row(const double* f, double* out) nogil:
+    """One 15-wide feature row -> 4 sub-scores (see _jit.py column order)."""
+    cdef double time_factor
+    out[0] = _clamp(0.35 * f[0] + 0.30 * f[1] + 0.20 * f[2] + 0.15 * f[3], 0.0, 10.0)
+    out[1] = _clamp(
+        0.40 * f[4] + 0.30 * f[5] + 0.15 * f[6] + 0.15 * (10.0 - f[7]), 0.0, 10.0
+    )
+    if f[8] > 0.0:
+        time_factor = 1.0 / (1.0 + exp((f[8] - 180.0) / 60.0))
+    else:
+        time_factor = 0.5
+    out[2] = _clamp(
+        0.5 + 2.5 * (0.60 * time_factor + 0.025 * f[9] + 0.015 * f[10]), 0.5, 3.0
+    )
+    if f[14] != 0.0:
+        out[3] = _clamp(
+            (0.40 * f[11] + 0.35 * f[12] + 0.25 * f[13]) / 10.0 * 0.5, 0.0, 0.5
+        )
+    else:
+        out[3] = 0.0
+
+
+cdef public void acei_batch_c(const double* in_features, double* out_subscores, long n) nogil:
+    """C ABI entry point: n rows of 15 features -> n rows of 4 sub-scores.
+
+    Exported so non-Python callers (ctypes/cffi, other services) can
+    invoke the scoring kernel without crossing the interpreter.
+    """
+    cdef long k
+    for k in range(n):
+        _acei_row(in_features + 15 * k, out_subscores + 4 * k)
+
+
+def compute_batch_subscores(double[:, ::1] features, double[:, ::1] out):
+    """Fill out (N, 4) with sub-scores for an (N, 15) feature matrix.
+
+    Both arrays must be C-contiguous float64; the loop releases the
+    GIL and parallelises across rows when built with OpenMP.
+    """
+    cdef Py_ssize_t k, n = features.shape[0]
+    if features.shape[1] != 15:
+        raise ValueError("features must have 15 columns")
+    if out.shape[0] != n or out.shape[1] != 4:
+        raise ValueError("out must be (N, 4)")
+    for k in prange(n, nogil=True):
+        _acei_row(&features[k, 0], &out[k, 0])
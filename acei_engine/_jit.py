@@ -0,0 +1,66 @@
+"""
+Optional Numba-JIT scalar core.
+
+Escape hatch for deployments that cannot add a C toolchain (so cannot
+build _acei_core): when numba is installed, the sub-score math is
+JIT-compiled (and disk-cached) instead. compute.py prefers the Cython
+extension, then this, then the pure-Python modules.
+
+fastmath is deliberately left off: the engine's outputs are pinned by
+golden tests and must be bit-identical across all three paths.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on deploy environment
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _acei_raw(rs, fe, od, sb, eh, rm, ps, ir, dte, af, cs, ci, mc, rc, has_mit):
+        impact = 0.35 * rs + 0.30 * fe + 0.20 * od + 0.15 * sb
+        impact = min(max(impact, 0.0), 10.0)
+
+        likelihood = 0.40 * eh + 0.30 * rm + 0.15 * ps + 0.15 * (10.0 - ir)
+        likelihood = min(max(likelihood, 0.0), 10.0)
+
+        if dte > 0:
+            time_factor = 1.0 / (1.0 + math.exp((dte - 180.0) / 60.0))
+        else:
+            time_factor = 0.5
+        velocity = 0.5 + 2.5 * (0.60 * time_factor + 0.025 * af + 0.015 * cs)
+        velocity = min(max(velocity, 0.5), 3.0)
+
+        mitigation = 0.0
+        if has_mit:
+            mitigation = (0.40 * ci + 0.35 * mc + 0.25 * rc) / 10.0 * 0.5
+            mitigation = min(max(mitigation, 0.0), 0.5)
+
+        return impact, likelihood, velocity, mitigation
+
+    @njit(cache=True, parallel=True)
+    def compute_batch_raw(features):
+        """
+        Sub-scores for an (N, 15) float64 feature matrix (columns in
+        _acei_raw argument order); returns an (N, 4) matrix of
+        (impact, likelihood, velocity, mitigation) rows.
+        """
+        n = features.shape[0]
+        out = np.empty((n, 4))
+        for k in prange(n):
+            f = features[k]
+            out[k, 0], out[k, 1], out[k, 2], out[k, 3] = _acei_raw(
+                f[0], f[1], f[2], f[3], f[4], f[5], f[6], f[7],
+                f[8], f[9], f[10], f[11], f[12], f[13], f[14] != 0.0,
+            )
+        return out
+
+    compute_subscores_njit = _acei_raw
+else:
+    compute_batch_raw = None
+    compute_subscores_njit = None
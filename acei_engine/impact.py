@@ -0,0 +1,39 @@
+"""
+Impact (I) sub-score.
+
+Weighted blend of the four impact dimensions, bounded [0, 10].
+"""
+
+import numpy as np
+
+from acei_engine.models import ACEIInput
+from acei_engine.normalise import clamp
+
+# Weight vector ordered (regulatory_severity, financial_exposure,
+# operational_disruption, scope_breadth); one dot product per score
+# instead of four dict lookups and mul-adds.
+_W = np.array([0.35, 0.30, 0.20, 0.15])
+
+DIMENSIONS = (
+    "regulatory_severity",
+    "financial_exposure",
+    "operational_disruption",
+    "scope_breadth",
+)
+
+WEIGHTS = dict(zip(DIMENSIONS, _W.tolist()))
+
+# Unpacked plain-float weights for the scalar path: LOAD_GLOBAL of a
+# float constant beats building a NumPy vector per call.
+_W_RS, _W_FE, _W_OD, _W_SB = _W.tolist()
+
+
+def compute_impact(inp: ACEIInput) -> float:
+    """Compute the impact sub-score (0-10) for one input."""
+    score = (
+        inp.regulatory_severity * _W_RS
+        + inp.financial_exposure * _W_FE
+        + inp.operational_disruption * _W_OD
+        + inp.scope_breadth * _W_SB
+    )
+    return clamp(score, 0.0, 10.0)
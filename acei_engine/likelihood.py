@@ -0,0 +1,39 @@
+"""
+Likelihood (L) sub-score.
+
+Weighted blend of the four likelihood dimensions, bounded [0, 10].
+Implementation readiness is inverted: a well-prepared organisation
+lowers the likelihood of exposure crystallising.
+"""
+
+import numpy as np
+
+from acei_engine.models import ACEIInput
+from acei_engine.normalise import clamp
+
+# Weight vector ordered (enforcement_history, regulatory_momentum,
+# political_salience, inverted implementation_readiness).
+_W = np.array([0.40, 0.30, 0.15, 0.15])
+
+DIMENSIONS = (
+    "enforcement_history",
+    "regulatory_momentum",
+    "political_salience",
+    "implementation_readiness",
+)
+
+WEIGHTS = dict(zip(DIMENSIONS, _W.tolist()))
+
+# Unpacked plain-float weights for the scalar path (see impact.py).
+_W_EH, _W_RM, _W_PS, _W_IR = _W.tolist()
+
+
+def compute_likelihood(inp: ACEIInput) -> float:
+    """Compute the likelihood sub-score (0-10) for one input."""
+    score = (
+        inp.enforcement_history * _W_EH
+        + inp.regulatory_momentum * _W_RM
+        + inp.political_salience * _W_PS
+        + (10.0 - inp.implementation_readiness) * _W_IR
+    )
+    return clamp(score, 0.0, 10.0)
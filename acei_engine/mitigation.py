@@ -0,0 +1,39 @@
+"""
+Mitigation credit.
+
+Weighted blend of the organisation's mitigation posture, scaled to a
+fractional credit in [0, 0.5] that discounts the adjusted score.
+"""
+
+import numpy as np
+
+from acei_engine.models import MitigationInput
+from acei_engine.normalise import clamp
+
+# Weight vector ordered (controls_in_place, monitoring_coverage,
+# response_capability).
+_W = np.array([0.40, 0.35, 0.25])
+
+DIMENSIONS = (
+    "controls_in_place",
+    "monitoring_coverage",
+    "response_capability",
+)
+
+WEIGHTS = dict(zip(DIMENSIONS, _W.tolist()))
+
+MAX_CREDIT = 0.5
+
+# Unpacked plain-float weights for the scalar path (see impact.py).
+_W_CI, _W_MC, _W_RC = _W.tolist()
+
+
+def compute_mitigation(mit: MitigationInput) -> float:
+    """Compute the mitigation credit (0-0.5) for one mitigation input."""
+    weighted = (
+        mit.controls_in_place * _W_CI
+        + mit.monitoring_coverage * _W_MC
+        + mit.response_capability * _W_RC
+    )
+    credit = weighted / 10.0 * MAX_CREDIT
+    return clamp(credit, 0.0, MAX_CREDIT)
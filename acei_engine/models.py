@@ -0,0 +1,137 @@
+"""
+Pydantic models for the ACEI scoring engine.
+
+Input dimensions are scored 0-10 by upstream classification;
+the engine composes them into a 0-100 exposure score with an
+A-F grade (A = lowest exposure).
+"""
+
+import sys
+from datetime import datetime
+from enum import StrEnum
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
+
+
+def _intern_str(v):
+    """Collapse duplicate tenant ids to one string object: large
+    batches repeat few organisations, and interned ids make dict
+    keying downstream a pointer comparison."""
+    return sys.intern(v) if isinstance(v, str) else v
+
+
+class _CachedLookupEnum(StrEnum):
+    """StrEnum whose by-value lookup misses resolve through a plain
+    value->member dict (built once per class, below), keeping coercion
+    of incoming strings on a single-dict-lookup fast path instead of
+    the _missing_ fallback scan."""
+
+    @classmethod
+    def _missing_(cls, value):
+        return cls._CACHE.get(value)
+
+
+class RiskCategory(_CachedLookupEnum):
+    """The 12 ACEI risk categories (Annex A)."""
+    UNFAIR_DISMISSAL = "unfair_dismissal"
+    DISCRIMINATION_HARASSMENT = "discrimination_harassment"
+    WAGES_WORKING_TIME = "wages_working_time"
+    WHISTLEBLOWING = "whistleblowing"
+    EMPLOYMENT_STATUS = "employment_status"
+    REDUNDANCY_ORG_CHANGE = "redundancy_org_change"
+    PARENTAL_FAMILY_RIGHTS = "parental_family_rights"
+    TRADE_UNION_COLLECTIVE = "trade_union_collective"
+    BREACH_OF_CONTRACT = "breach_of_contract"
+    HEALTH_SAFETY = "health_safety"
+    DATA_PROTECTION_PRIVACY = "data_protection_privacy"
+    BUSINESS_TRANSFERS_INSOLVENCY = "business_transfers_insolvency"
+
+
+class Jurisdiction(_CachedLookupEnum):
+    GB = "GB"
+    EU = "EU"
+    US = "US"
+
+
+RiskCategory._CACHE = {e.value: e for e in RiskCategory}
+Jurisdiction._CACHE = {e.value: e for e in Jurisdiction}
+
+
+class MitigationInput(BaseModel):
+    """Organisation-side mitigation posture, each dimension 0-10."""
+    controls_in_place: float = Field(ge=0, le=10)
+    monitoring_coverage: float = Field(ge=0, le=10)
+    response_capability: float = Field(ge=0, le=10)
+
+
+class ACEIInput(BaseModel):
+    """One scoring request: an organisation exposed to a risk category."""
+    organization_id: str
+    risk_category: RiskCategory
+    jurisdiction: Jurisdiction = Jurisdiction.GB
+
+    # Impact dimensions (0-10)
+    regulatory_severity: float = Field(ge=0, le=10)
+    financial_exposure: float = Field(ge=0, le=10)
+    operational_disruption: float = Field(ge=0, le=10)
+    scope_breadth: float = Field(ge=0, le=10)
+
+    # Likelihood dimensions (0-10)
+    enforcement_history: float = Field(ge=0, le=10)
+    regulatory_momentum: float = Field(ge=0, le=10)
+    political_salience: float = Field(ge=0, le=10)
+    implementation_readiness: float = Field(ge=0, le=10)
+
+    # Velocity dimensions
+    days_to_effective: int = 0
+    amendment_frequency: float = Field(default=0.0, ge=0, le=10)
+    consultation_stage: float = Field(default=0.0, ge=0, le=10)
+
+    mitigation: Optional[MitigationInput] = None
+
+    _intern_org = field_validator("organization_id", mode="before")(_intern_str)
+
+
+class ACEIScore(BaseModel):
+    """Computed ACEI score with full component breakdown.
+
+    Frozen: scores are immutable once computed, which also lets
+    instances be hashed and shared across threads safely.
+
+    Fields carry full-precision floats; presentation rounding happens
+    once, on serialisation, rather than per component in the compute
+    hot path.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    organization_id: str
+    risk_category: RiskCategory
+    jurisdiction: Jurisdiction
+
+    impact_score: float
+    likelihood_score: float
+    velocity_multiplier: float
+    mitigation_credit: float
+
+    raw_score: float
+    adjusted_score: float
+    final_score: float
+    grade: str
+
+    version: str
+    computed_at: datetime
+
+    _intern_org = field_validator("organization_id", mode="before")(_intern_str)
+
+    @model_serializer(mode="wrap")
+    def _round_for_display(self, handler):
+        data = handler(self)
+        data["impact_score"] = round(data["impact_score"], 2)
+        data["likelihood_score"] = round(data["likelihood_score"], 2)
+        data["velocity_multiplier"] = round(data["velocity_multiplier"], 4)
+        data["mitigation_credit"] = round(data["mitigation_credit"], 4)
+        data["raw_score"] = round(data["raw_score"], 2)
+        data["adjusted_score"] = round(data["adjusted_score"], 2)
+        data["final_score"] = round(data["final_score"], 2)
+        return data
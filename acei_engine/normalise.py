@@ -0,0 +1,44 @@
+"""
+Normalisation and grading.
+
+The composed score has a theoretical maximum of 300
+(impact 10 x likelihood 10 x velocity 3.0); it is normalised
+onto 0-100 and banded into grades A-F (A = lowest exposure).
+"""
+
+import bisect
+
+import numpy as np
+
+MAX_THEORETICAL = 300.0
+
+# Grade band cut points; scores on a cut fall into the higher band.
+_GRADE_CUTS = np.array([20.0, 40.0, 60.0, 80.0])
+_GRADES = np.array(["A", "B", "C", "D", "F"])
+
+# Plain-list twins for the scalar path: bisect on a small Python list
+# beats NumPy call overhead for single scores.
+_GRADE_CUTS_LIST = _GRADE_CUTS.tolist()
+_GRADES_LIST = _GRADES.tolist()
+
+
+def clamp(x: float, lo: float, hi: float) -> float:
+    """Scalar clamp via conditional expressions; avoids the generic
+    min()/max() call overhead on hot paths."""
+    return lo if x < lo else (hi if x > hi else x)
+
+
+def normalise_to_100(score: float, max_theoretical: float = MAX_THEORETICAL) -> float:
+    """Scale a composed score onto 0-100, clamped."""
+    scaled = (score / max_theoretical) * 100.0
+    return clamp(scaled, 0.0, 100.0)
+
+
+def score_to_grade(score: float) -> str:
+    """Band a 0-100 score into a grade (A = lowest exposure)."""
+    return _GRADES_LIST[bisect.bisect_right(_GRADE_CUTS_LIST, score)]
+
+
+def score_to_grade_vec(scores: np.ndarray) -> np.ndarray:
+    """Vectorised score_to_grade for an array of 0-100 scores."""
+    return _GRADES[np.searchsorted(_GRADE_CUTS, scores, side="right")]
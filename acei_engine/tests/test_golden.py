@@ -0,0 +1,143 @@
+"""
+Golden tests for the ACEI scoring engine.
+
+Pins exact scores for canonical inputs so that any change to weights,
+clamping, rounding or composition order shows up as a diff here.
+"""
+
+from acei_engine import (
+    ACEIInput,
+    MitigationInput,
+    compute_acei,
+    compute_batch,
+    compute_batch_vec,
+)
+from acei_engine.normalise import score_to_grade
+from acei_engine.velocity import compute_velocity
+
+
+def _make_input(**overrides) -> ACEIInput:
+    base = dict(
+        organization_id="org-001",
+        risk_category="whistleblowing",
+        regulatory_severity=8.0,
+        financial_exposure=7.0,
+        operational_disruption=6.0,
+        scope_breadth=5.0,
+        enforcement_history=7.0,
+        regulatory_momentum=8.0,
+        political_salience=6.0,
+        implementation_readiness=3.0,
+        days_to_effective=90,
+        amendment_frequency=4.0,
+        consultation_stage=6.0,
+    )
+    base.update(overrides)
+    return ACEIInput(**base)
+
+
+def test_golden_high_risk_no_mitigation():
+    # Fields hold full precision; goldens pin the serialised
+    # (presentation-rounded) values.
+    score = compute_acei(_make_input()).model_dump()
+    assert score["impact_score"] == 6.85
+    assert score["likelihood_score"] == 7.15
+    assert score["velocity_multiplier"] == 2.2014
+    assert score["mitigation_credit"] == 0.0
+    assert score["raw_score"] == 48.98
+    assert score["adjusted_score"] == 107.82
+    assert score["final_score"] == 35.94
+    assert score["grade"] == "B"
+    assert score["version"] == "v1.0.0"
+
+
+def test_golden_with_mitigation():
+    score = compute_acei(
+        _make_input(
+            mitigation=MitigationInput(
+                controls_in_place=8.0,
+                monitoring_coverage=7.0,
+                response_capability=6.0,
+            )
+        )
+    ).model_dump()
+    assert score["mitigation_credit"] == 0.3575
+    assert score["final_score"] == 23.09
+    assert score["grade"] == "B"
+
+
+def test_golden_zero_exposure():
+    score = compute_acei(
+        _make_input(
+            organization_id="org-002",
+            risk_category="health_safety",
+            regulatory_severity=0,
+            financial_exposure=0,
+            operational_disruption=0,
+            scope_breadth=0,
+            enforcement_history=0,
+            regulatory_momentum=0,
+            political_salience=0,
+            implementation_readiness=10,
+            days_to_effective=0,
+            amendment_frequency=0,
+            consultation_stage=0,
+        )
+    )
+    assert score.final_score == 0.0
+    assert score.grade == "A"
+    # Effective-now with no pressure dimensions -> neutral floor pressure.
+    assert score.velocity_multiplier == 1.25
+
+
+def test_grade_boundaries():
+    assert score_to_grade(0.0) == "A"
+    assert score_to_grade(19.99) == "A"
+    assert score_to_grade(20.0) == "B"
+    assert score_to_grade(40.0) == "C"
+    assert score_to_grade(60.0) == "D"
+    assert score_to_grade(80.0) == "F"
+    assert score_to_grade(100.0) == "F"
+
+
+def test_velocity_lut_matches_exact():
+    for dte in (1, 30, 90, 180, 365, 720, 3650):
+        inp = _make_input(days_to_effective=dte)
+        approx = compute_velocity(inp)
+        exact = compute_velocity(inp, use_exact=True)
+        assert abs(approx - exact) < 1e-4
+
+
+def test_batch_from_dicts_matches_models():
+    from acei_engine import compute_batch_from_dicts
+
+    raw = [_make_input().model_dump(), _make_input(organization_id="org-005").model_dump()]
+    from_dicts = compute_batch_from_dicts(raw)
+    from_models = compute_batch([_make_input(), _make_input(organization_id="org-005")])
+    for a, b in zip(from_dicts, from_models):
+        assert a.model_dump(exclude={"computed_at"}) == b.model_dump(
+            exclude={"computed_at"}
+        )
+
+
+def test_batch_vec_matches_scalar():
+    inputs = [
+        _make_input(),
+        _make_input(
+            organization_id="org-003",
+            days_to_effective=365,
+            mitigation=MitigationInput(
+                controls_in_place=2.0,
+                monitoring_coverage=3.0,
+                response_capability=1.0,
+            ),
+        ),
+        _make_input(organization_id="org-004", days_to_effective=-10),
+    ]
+    scalar = compute_batch(inputs)
+    vectorised = compute_batch_vec(inputs)
+    assert len(scalar) == len(vectorised)
+    for s, v in zip(scalar, vectorised):
+        assert s.model_dump(exclude={"computed_at"}) == v.model_dump(
+            exclude={"computed_at"}
+        )
@@ -0,0 +1,8 @@
+"""
+ACEI engine version identifier.
+
+Must track the active row in the `acei_versions` table
+(see api/settings.py ACEI_ACTIVE_VERSION).
+"""
+
+ACEI_VERSION = "v1.0.0"
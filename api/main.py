@@ -1,9 +1,19 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List
 from api.deps import supabase_client
+from acei_engine.compute import (
+    compute_batch_from_dicts,
+    compute_batch_iter,
+    dump_scores,
+    parse_inputs,
+)
 
-app = FastAPI(title="Ailane ACEI API")
+# ORJSONResponse serialises datetimes and NumPy scalars in C;
+# uvicorn[standard] already ships uvloop (run with --loop uvloop).
+app = FastAPI(title="Ailane ACEI API", default_response_class=ORJSONResponse)
 
 
 # =========================
@@ -39,6 +49,39 @@ def active_version():
     return data[0]
 
 
+# =========================
+# BATCH SCORING
+# =========================
+@app.post("/score/batch")
+def score_batch(payload: List[dict]):
+    try:
+        scores = compute_batch_from_dicts(payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+
+    return {
+        "count": len(scores),
+        "scores": dump_scores(scores),
+    }
+
+
+# =========================
+# STREAMING SCORING (NDJSON)
+# =========================
+@app.post("/score/stream")
+def score_stream(payload: List[dict]):
+    try:
+        inputs = parse_inputs(payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+
+    def ndjson():
+        for score in compute_batch_iter(inputs):
+            yield orjson.dumps(score.model_dump()) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 # =========================
 # UPDATE MODEL
 # =========================
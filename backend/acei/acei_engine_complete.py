@@ -15,13 +15,24 @@ Based on:
 - acei_eii_sci_module_v6.py
 """
 
+import bisect
+import functools
+
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from supabase import Client
 import logging
 
+# Optional int-coded kernels (JIT-compiled when numba is installed)
+# for callers that pre-encode events at DB-load time.
+try:
+    from backend.scrapers import _eii_numba as _eii_kernels
+except ImportError:  # pragma: no cover - flat script execution
+    _eii_kernels = None
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -44,6 +55,14 @@ EVI_BASELINES = {
     "transfers_insolvency": 5
 }
 
+# Vectorised EVI constants: ratio thresholds (Annex A) as cut points
+# for a branchless searchsorted/bisect lookup, plus baselines aligned
+# to a fixed category order for whole-dict scoring in one pass.
+EVI_CATEGORIES = tuple(EVI_BASELINES.keys())
+EVI_RATIO_CUTS = np.array([1.10, 1.25, 1.50, 2.00])
+_EVI_RATIO_CUTS_LIST = EVI_RATIO_CUTS.tolist()
+_EVI_BASELINE_VEC = np.array([EVI_BASELINES[c] for c in EVI_CATEGORIES], dtype=float)
+
 # Likelihood weights (Article III)
 LIKELIHOOD_WEIGHTS = {
     'evi': 0.40,
@@ -67,6 +86,64 @@ SCI_WEIGHTS = {
     'mps': 0.10   # Market Practice Shift
 }
 
+# The weight dicts above stay as the documented source of truth; the
+# hot compute paths read these hoisted floats so each weighted sum
+# costs zero dict lookups.
+_W_RAS, _W_TAS, _W_GPS, _W_MVS = (EII_WEIGHTS[k] for k in ('ras', 'tas', 'gps', 'mvs'))
+_W_SCS, _W_CLS, _W_IPS, _W_MPS = (SCI_WEIGHTS[k] for k in ('scs', 'cls', 'ips', 'mps'))
+_W_EVI, _W_EII, _W_SCI = (LIKELIHOOD_WEIGHTS[k] for k in ('evi', 'eii', 'sci'))
+
+# Component-score increment tables. Each scoring loop used to walk a
+# chain of if/elif string comparisons per event; the tables collapse
+# that to one dict lookup per event (keys mirror the original branch
+# order and defaults).
+_RAS_TYPE_KEYS = ('naming', 'prosecution', 'investigation', 'notice', 'warning')
+_RAS_TABLE = {
+    ('naming', 'high'): 15, ('naming', 'low'): 10,
+    ('prosecution', 'high'): 15, ('prosecution', 'low'): 10,
+    ('investigation', 'high'): 10, ('investigation', 'low'): 5,
+    ('notice', 'high'): 5, ('notice', 'low'): 2,
+    ('warning', 'high'): 5, ('warning', 'low'): 2,
+}
+_GPS_TABLE = {'major': 20, 'moderate': 10}       # default 5
+_SCS_TABLE = {
+    'transformational': 25, 'significant': 15, 'notable': 10, 'incremental': 5,
+}
+_CLS_TABLE = {
+    ('supreme_court', 'major'): 20, ('supreme_court', 'other'): 10,
+    ('eat', 'major'): 15, ('eat', 'other'): 7,
+}                                                # default 5
+_IPS_TABLE = {'national': 15, 'sector': 10}      # default 5
+_MPS_TABLE = {'widespread': 10, 'growing': 5}    # default 0
+
+# EVI (1-5) -> TAS (0-100); slot 0 is the out-of-range fallback
+# (20 = minimal activity). Tuple for scalar lookups, float32 vector
+# twin for the batch path.
+_TAS_MAP = (20.0, 20.0, 40.0, 60.0, 80.0, 100.0)
+_TAS_BY_EVI = np.array(_TAS_MAP, dtype=np.float32)
+
+# ordinal_map as a 101-entry table: _ORDINAL[int(score)] is the 1-5
+# ordinal, turning the quantizer into one indexed load (bands are
+# 20-wide with 100 folded into band 5, exactly as ordinal_map).
+_ORDINAL = np.repeat(
+    np.arange(1, 6, dtype=np.int8), (20, 20, 20, 20, 21)
+)
+
+# log10 over the mention-count domain, precomputed: _LOG10_TABLE[m] is
+# log10(m) for m in 1..100_000 (index 0 is a filler). Counts above the
+# table saturate at 100_000, where the MVS already caps at 100, so the
+# per-call transcendental becomes an indexed load.
+_LOG10_TABLE = np.concatenate(
+    ([0.0], np.log10(np.arange(1, 100_001)))
+).astype(np.float32)
+
+def _classify(event_type: str) -> Optional[str]:
+    """Return the first RAS type token contained in event_type, if any."""
+    for key in _RAS_TYPE_KEYS:
+        if key in event_type:
+            return key
+    return None
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -90,6 +167,11 @@ def ordinal_map(score_100: float) -> int:
     ordinal = 1 + int(score_100 // 20)
     return min(5, ordinal)  # Cap at 5
 
+def ordinal_map_vec(scores_100: np.ndarray) -> np.ndarray:
+    """Vectorised ordinal_map: array of 0-100 scores -> int8 ordinals 1-5."""
+    banded = np.clip(scores_100, 0, 100) // 20
+    return np.minimum(np.int8(5), banded.astype(np.int8) + np.int8(1))
+
 # =============================================================================
 # EVI CALCULATION (Event Volume Index)
 # =============================================================================
@@ -116,18 +198,9 @@ class EVICalculator:
         """
         baseline = EVI_BASELINES.get(category, 1)
         ratio = weekly_count / baseline if baseline > 0 else 0
-        
-        # Ratio-based thresholds (Annex A)
-        if ratio <= 1.10:
-            return 1
-        elif ratio <= 1.25:
-            return 2
-        elif ratio <= 1.50:
-            return 3
-        elif ratio <= 2.00:
-            return 4
-        else:
-            return 5
+
+        # Ratio-based thresholds (Annex A), branchless
+        return bisect.bisect_left(_EVI_RATIO_CUTS_LIST, ratio) + 1
     
     @staticmethod
     def calculate_all_evi(supabase: Client, lookback_days: int = 7) -> Dict[str, int]:
@@ -158,11 +231,17 @@ class EVICalculator:
                 if primary_cat in category_counts:
                     category_counts[primary_cat] += 1
             
-            # Calculate EVI for each category
-            evi_scores = {}
-            for category, count in category_counts.items():
-                evi_scores[category] = EVICalculator.calculate_evi(category, count)
-            
+            # Calculate EVI for all categories in one vectorised pass
+            counts = np.fromiter(
+                (category_counts[c] for c in EVI_CATEGORIES),
+                dtype=float,
+                count=len(EVI_CATEGORIES)
+            )
+            scores = np.searchsorted(
+                EVI_RATIO_CUTS, counts / _EVI_BASELINE_VEC, side='left'
+            ) + 1
+            evi_scores = {c: int(s) for c, s in zip(EVI_CATEGORIES, scores)}
+
             logger.info(f"Calculated EVI scores: {evi_scores}")
             return evi_scores
             
@@ -201,23 +280,35 @@ class EIICalculator:
         if not enforcement_events:
             return 20.0  # Baseline minimal activity
         
-        # Score based on event count and severity
-        score = 20.0  # Baseline
-        
-        for event in enforcement_events:
-            event_type = event.get('type', '')
-            severity = event.get('severity', 'low')
-            
-            # Weight by type
-            if 'naming' in event_type or 'prosecution' in event_type:
-                score += 15 if severity == 'high' else 10
-            elif 'investigation' in event_type:
-                score += 10 if severity == 'high' else 5
-            elif 'notice' in event_type or 'warning' in event_type:
-                score += 5 if severity == 'high' else 2
-        
+        # Baseline plus one table lookup per event
+        score = 20.0 + sum(
+            _RAS_TABLE.get(
+                (
+                    _classify(event.get('type', '')),
+                    'high' if event.get('severity', 'low') == 'high' else 'low'
+                ),
+                0
+            )
+            for event in enforcement_events
+        )
+
         return min(100, score)
-    
+
+    @staticmethod
+    def calculate_ras_encoded(type_codes, sev_codes) -> float:
+        """
+        calculate_ras over pre-encoded int8 arrays
+        (see _eii_numba.encode_ras_events). Same scores, JIT loop.
+        """
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        return min(
+            100,
+            20.0 + _eii_kernels.sum_pair_table(
+                type_codes, sev_codes, _eii_kernels.RAS_TABLE
+            )
+        )
+
     @staticmethod
     def calculate_tas(category: str, evi_score: int) -> float:
         """
@@ -225,15 +316,8 @@ class EIICalculator:
         
         Derived from EVI - higher tribunal volume = higher enforcement signal.
         """
-        # Map EVI (1-5) to TAS (0-100)
-        tas_map = {
-            1: 20,  # Minimal activity
-            2: 40,  # Routine
-            3: 60,  # Elevated
-            4: 80,  # Intensive
-            5: 100  # Maximum
-        }
-        return tas_map.get(evi_score, 20)
+        # Map EVI (1-5) to TAS (0-100) via the module-level table
+        return _TAS_MAP[evi_score] if 1 <= evi_score <= 5 else 20.0
     
     @staticmethod
     def calculate_gps(guidance_updates: List[Dict]) -> float:
@@ -245,18 +329,23 @@ class EIICalculator:
         if not guidance_updates:
             return 30.0  # Baseline
         
-        score = 30.0
-        for update in guidance_updates:
-            scope = update.get('scope', 'minor')
-            if scope == 'major':
-                score += 20
-            elif scope == 'moderate':
-                score += 10
-            else:
-                score += 5
-        
+        score = 30.0 + sum(
+            _GPS_TABLE.get(update.get('scope', 'minor'), 5)
+            for update in guidance_updates
+        )
+
         return min(100, score)
-    
+
+    @staticmethod
+    def calculate_gps_encoded(scope_codes) -> float:
+        """calculate_gps over pre-encoded int8 scope codes."""
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        return min(
+            100,
+            30.0 + _eii_kernels.sum_table(scope_codes, _eii_kernels.GPS_TABLE)
+        )
+
     @staticmethod
     def calculate_mvs(media_mentions: int) -> float:
         """
@@ -264,12 +353,12 @@ class EIICalculator:
         
         Based on employment law media coverage count.
         """
-        # Logarithmic scaling
-        if media_mentions == 0:
+        # Logarithmic scaling via the precomputed table
+        if media_mentions <= 0:
             return 10.0
-        
-        score = 10 + (np.log10(media_mentions) * 30)
-        return min(100, score)
+
+        idx = min(media_mentions, 100_000)
+        return min(100.0, 10.0 + float(_LOG10_TABLE[idx]) * 30.0)
     
     @staticmethod
     def compute_eii(
@@ -290,14 +379,14 @@ class EIICalculator:
         Returns:
             EII ordinal (1-5)
         """
-        eii_100 = (
-            EII_WEIGHTS['ras'] * ras +
-            EII_WEIGHTS['tas'] * tas +
-            EII_WEIGHTS['gps'] * gps +
-            EII_WEIGHTS['mvs'] * mvs
-        )
-        
-        return ordinal_map(eii_100)
+        return int(_ORDINAL[min(100, max(0, int(
+            EIICalculator._eii_100(ras, tas, gps, mvs)
+        )))])
+
+    @staticmethod
+    def _eii_100(ras: float, tas: float, gps: float, mvs: float) -> float:
+        """Weighted 0-100 EII score (shared by ordinal + breakdown)."""
+        return _W_RAS * ras + _W_TAS * tas + _W_GPS * gps + _W_MVS * mvs
     
     @staticmethod
     def calculate_eii_for_category(
@@ -326,21 +415,17 @@ class EIICalculator:
             tas = EIICalculator.calculate_tas(category, evi_score)
             gps = EIICalculator.calculate_gps(guidance_updates)
             mvs = EIICalculator.calculate_mvs(media_mentions)
-            
-            # Compute EII
-            eii = EIICalculator.compute_eii(ras, tas, gps, mvs)
-            
+
+            # Compute EII (weighted score once, ordinal from it)
+            eii_100 = EIICalculator._eii_100(ras, tas, gps, mvs)
+            eii = int(_ORDINAL[min(100, max(0, int(eii_100)))])
+
             components = {
                 'ras': ras,
                 'tas': tas,
                 'gps': gps,
                 'mvs': mvs,
-                'eii_100': (
-                    EII_WEIGHTS['ras'] * ras +
-                    EII_WEIGHTS['tas'] * tas +
-                    EII_WEIGHTS['gps'] * gps +
-                    EII_WEIGHTS['mvs'] * mvs
-                ),
+                'eii_100': eii_100,
                 'eii_ordinal': eii
             }
             
@@ -377,21 +462,21 @@ class SCICalculator:
         if not statutory_changes:
             return 50.0  # Neutral
         
-        score = 50.0
-        for change in statutory_changes:
-            impact = change.get('impact', 'minor')
-            
-            if impact == 'transformational':
-                score += 25
-            elif impact == 'significant':
-                score += 15
-            elif impact == 'notable':
-                score += 10
-            elif impact == 'incremental':
-                score += 5
-        
+        score = 50.0 + sum(
+            _SCS_TABLE.get(change.get('impact', 'minor'), 0)
+            for change in statutory_changes
+        )
+
         return min(100, max(0, score))
-    
+
+    @staticmethod
+    def calculate_scs_encoded(impact_codes) -> float:
+        """calculate_scs over pre-encoded int8 impact codes."""
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        score = 50.0 + _eii_kernels.sum_table(impact_codes, _eii_kernels.SCS_TABLE)
+        return min(100, max(0, score))
+
     @staticmethod
     def calculate_cls(case_law_shifts: List[Dict]) -> float:
         """
@@ -402,20 +487,32 @@ class SCICalculator:
         if not case_law_shifts:
             return 50.0  # Neutral
         
-        score = 50.0
-        for shift in case_law_shifts:
-            court = shift.get('court', 'lower')
-            impact = shift.get('impact', 'minor')
-            
-            if court == 'supreme_court':
-                score += 20 if impact == 'major' else 10
-            elif court == 'eat':
-                score += 15 if impact == 'major' else 7
-            else:
-                score += 5
-        
+        score = 50.0 + sum(
+            _CLS_TABLE.get(
+                (
+                    shift.get('court', 'lower'),
+                    'major' if shift.get('impact', 'minor') == 'major' else 'other'
+                ),
+                5
+            )
+            for shift in case_law_shifts
+        )
+
         return min(100, max(0, score))
-    
+
+    @staticmethod
+    def calculate_cls_encoded(court_codes, major_codes) -> float:
+        """
+        calculate_cls over pre-encoded int8 arrays
+        (see _eii_numba.encode_cls_shifts).
+        """
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        score = 50.0 + _eii_kernels.sum_pair_table(
+            court_codes, major_codes, _eii_kernels.CLS_TABLE
+        )
+        return min(100, max(0, score))
+
     @staticmethod
     def calculate_ips(policy_shifts: List[Dict]) -> float:
         """
@@ -426,19 +523,21 @@ class SCICalculator:
         if not policy_shifts:
             return 50.0  # Neutral
         
-        score = 50.0
-        for shift in policy_shifts:
-            scope = shift.get('scope', 'minor')
-            
-            if scope == 'national':
-                score += 15
-            elif scope == 'sector':
-                score += 10
-            else:
-                score += 5
-        
+        score = 50.0 + sum(
+            _IPS_TABLE.get(shift.get('scope', 'minor'), 5)
+            for shift in policy_shifts
+        )
+
         return min(100, max(0, score))
-    
+
+    @staticmethod
+    def calculate_ips_encoded(scope_codes) -> float:
+        """calculate_ips over pre-encoded int8 scope codes."""
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        score = 50.0 + _eii_kernels.sum_table(scope_codes, _eii_kernels.IPS_TABLE)
+        return min(100, max(0, score))
+
     @staticmethod
     def calculate_mps(market_shifts: List[Dict]) -> float:
         """
@@ -449,17 +548,21 @@ class SCICalculator:
         if not market_shifts:
             return 50.0  # Neutral
         
-        score = 50.0
-        for shift in market_shifts:
-            adoption = shift.get('adoption_rate', 'low')
-            
-            if adoption == 'widespread':
-                score += 10
-            elif adoption == 'growing':
-                score += 5
-        
+        score = 50.0 + sum(
+            _MPS_TABLE.get(shift.get('adoption_rate', 'low'), 0)
+            for shift in market_shifts
+        )
+
         return min(100, max(0, score))
-    
+
+    @staticmethod
+    def calculate_mps_encoded(adoption_codes) -> float:
+        """calculate_mps over pre-encoded int8 adoption codes."""
+        if _eii_kernels is None:
+            raise RuntimeError("backend.scrapers._eii_numba is not importable")
+        score = 50.0 + _eii_kernels.sum_table(adoption_codes, _eii_kernels.MPS_TABLE)
+        return min(100, max(0, score))
+
     @staticmethod
     def compute_sci(
         scs: float = 50.0,
@@ -479,14 +582,14 @@ class SCICalculator:
         Returns:
             SCI ordinal (1-5)
         """
-        sci_100 = (
-            SCI_WEIGHTS['scs'] * scs +
-            SCI_WEIGHTS['cls'] * cls +
-            SCI_WEIGHTS['ips'] * ips +
-            SCI_WEIGHTS['mps'] * mps
-        )
-        
-        return ordinal_map(sci_100)
+        return int(_ORDINAL[min(100, max(0, int(
+            SCICalculator._sci_100(scs, cls, ips, mps)
+        )))])
+
+    @staticmethod
+    def _sci_100(scs: float, cls: float, ips: float, mps: float) -> float:
+        """Weighted 0-100 SCI score (shared by ordinal + breakdown)."""
+        return _W_SCS * scs + _W_CLS * cls + _W_IPS * ips + _W_MPS * mps
     
     @staticmethod
     def calculate_sci_for_category(
@@ -512,21 +615,17 @@ class SCICalculator:
             cls = SCICalculator.calculate_cls(case_law_shifts)
             ips = SCICalculator.calculate_ips(policy_shifts)
             mps = SCICalculator.calculate_mps(market_shifts)
-            
-            # Compute SCI
-            sci = SCICalculator.compute_sci(scs, cls, ips, mps)
-            
+
+            # Compute SCI (weighted score once, ordinal from it)
+            sci_100 = SCICalculator._sci_100(scs, cls, ips, mps)
+            sci = int(_ORDINAL[min(100, max(0, int(sci_100)))])
+
             components = {
                 'scs': scs,
                 'cls': cls,
                 'ips': ips,
                 'mps': mps,
-                'sci_100': (
-                    SCI_WEIGHTS['scs'] * scs +
-                    SCI_WEIGHTS['cls'] * cls +
-                    SCI_WEIGHTS['ips'] * ips +
-                    SCI_WEIGHTS['mps'] * mps
-                ),
+                'sci_100': sci_100,
                 'sci_ordinal': sci
             }
             
@@ -551,9 +650,13 @@ class LikelihoodCalculator:
     """
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def compute_l(evi: int, eii: int, sci: int) -> int:
         """
         Compute Likelihood score.
+
+        Cached: only 125 distinct (evi, eii, sci) triples exist, so
+        repeat computes collapse to a dict hit.
         
         Args:
             evi: Event Volume Index (1-5)
@@ -563,11 +666,7 @@ class LikelihoodCalculator:
         Returns:
             L score (1-5)
         """
-        l_raw = (
-            LIKELIHOOD_WEIGHTS['evi'] * evi +
-            LIKELIHOOD_WEIGHTS['eii'] * eii +
-            LIKELIHOOD_WEIGHTS['sci'] * sci
-        )
+        l_raw = _W_EVI * evi + _W_EII * eii + _W_SCI * sci
         
         l_rounded = round(l_raw)
         
@@ -608,11 +707,7 @@ class LikelihoodCalculator:
             )
             
             # Calculate L
-            l_raw = (
-                LIKELIHOOD_WEIGHTS['evi'] * evi +
-                LIKELIHOOD_WEIGHTS['eii'] * eii +
-                LIKELIHOOD_WEIGHTS['sci'] * sci
-            )
+            l_raw = _W_EVI * evi + _W_EII * eii + _W_SCI * sci
             l = LikelihoodCalculator.compute_l(evi, eii, sci)
             
             result = {
@@ -645,6 +740,72 @@ class LikelihoodCalculator:
                 'error': str(e)
             }
 
+    @staticmethod
+    def calculate_all(categories: List[str], supabase: Client) -> pd.DataFrame:
+        """
+        Calculate Likelihood for all categories in one vectorised pass.
+
+        Assembles the EII/SCI component inputs as length-N float32
+        arrays and runs each weighted sum as a single NumPy expression
+        instead of N per-category scalar computations. Component
+        sourcing matches calculate_eii_for_category /
+        calculate_sci_for_category (placeholder tables pending).
+
+        Returns:
+            DataFrame with one row per category:
+            category, evi, eii_100, eii, sci_100, sci, l_raw, l
+        """
+        try:
+            evi_scores = EVICalculator.calculate_all_evi(supabase)
+            n = len(categories)
+            evi = np.fromiter(
+                (evi_scores.get(c, 1) for c in categories),
+                dtype=np.int8, count=n
+            )
+
+            # EII components (placeholders mirror calculate_eii_for_category)
+            ras = np.full(n, 20.0, dtype=np.float32)
+            gps = np.full(n, 30.0, dtype=np.float32)
+            mvs = np.full(n, 10.0, dtype=np.float32)
+            tas = _TAS_BY_EVI[np.clip(evi, 0, 5)]
+
+            eii_100 = _W_RAS * ras + _W_TAS * tas + _W_GPS * gps + _W_MVS * mvs
+            eii = ordinal_map_vec(eii_100)
+
+            # SCI components (placeholders mirror calculate_sci_for_category)
+            scs = np.full(n, 50.0, dtype=np.float32)
+            cls_ = np.full(n, 50.0, dtype=np.float32)
+            ips = np.full(n, 50.0, dtype=np.float32)
+            mps = np.full(n, 50.0, dtype=np.float32)
+
+            sci_100 = _W_SCS * scs + _W_CLS * cls_ + _W_IPS * ips + _W_MPS * mps
+            sci = ordinal_map_vec(sci_100)
+
+            l_raw = (
+                _W_EVI * evi.astype(np.float32) +
+                _W_EII * eii.astype(np.float32) +
+                _W_SCI * sci.astype(np.float32)
+            )
+            l = np.clip(np.rint(l_raw).astype(np.int8), 1, 5)
+
+            return pd.DataFrame({
+                'category': categories,
+                'evi': evi,
+                'eii_100': eii_100,
+                'eii': eii,
+                'sci_100': sci_100,
+                'sci': sci,
+                'l_raw': l_raw,
+                'l': l,
+            })
+
+        except Exception as e:
+            logger.error(f"Error calculating all likelihoods: {e}")
+            return pd.DataFrame(
+                columns=['category', 'evi', 'eii_100', 'eii',
+                         'sci_100', 'sci', 'l_raw', 'l']
+            )
+
 # =============================================================================
 # USAGE EXAMPLE
 # =============================================================================
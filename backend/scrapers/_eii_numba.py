@@ -0,0 +1,141 @@
+"""
+Optional Numba kernels for the EII/SCI component-score loops.
+
+Events are int-coded once at ingestion (encode_* helpers below) into
+small int8 arrays; the score accumulation then runs as a branchless
+table lookup per row inside a JIT-compiled loop instead of per-event
+dict lookups in the interpreter. When numba is not installed the same
+kernels run as pure-Python loops over the same coded arrays.
+
+fastmath/approximations are not needed here — the tables are integer
+increments, so coded and dict paths are exactly equal by construction.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on deploy environment
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Increment tables, aligned with the dict tables in
+# backend/acei/acei_engine_complete.py. Last row/entry of each table is
+# the "unrecognized" bucket so encoders never have to filter.
+
+# rows: naming, prosecution, investigation, notice, warning, other
+# cols: low, high
+RAS_TABLE = np.array(
+    [[10, 15], [10, 15], [5, 10], [2, 5], [2, 5], [0, 0]], dtype=np.int8
+)
+RAS_TYPE_CODES = {
+    'naming': 0, 'prosecution': 1, 'investigation': 2, 'notice': 3, 'warning': 4,
+}
+RAS_OTHER_CODE = 5
+
+# rows: supreme_court, eat, other; cols: non-major, major
+CLS_TABLE = np.array([[10, 20], [7, 15], [5, 5]], dtype=np.int8)
+CLS_COURT_CODES = {'supreme_court': 0, 'eat': 1}
+CLS_OTHER_CODE = 2
+
+# codes: major, moderate, other
+GPS_TABLE = np.array([20, 10, 5], dtype=np.int8)
+GPS_SCOPE_CODES = {'major': 0, 'moderate': 1}
+GPS_OTHER_CODE = 2
+
+# codes: transformational, significant, notable, incremental, other
+SCS_TABLE = np.array([25, 15, 10, 5, 0], dtype=np.int8)
+SCS_IMPACT_CODES = {
+    'transformational': 0, 'significant': 1, 'notable': 2, 'incremental': 3,
+}
+SCS_OTHER_CODE = 4
+
+# codes: national, sector, other
+IPS_TABLE = np.array([15, 10, 5], dtype=np.int8)
+IPS_SCOPE_CODES = {'national': 0, 'sector': 1}
+IPS_OTHER_CODE = 2
+
+# codes: widespread, growing, other
+MPS_TABLE = np.array([10, 5, 0], dtype=np.int8)
+MPS_ADOPTION_CODES = {'widespread': 0, 'growing': 1}
+MPS_OTHER_CODE = 2
+
+
+# =============================================================================
+# ENCODERS (run once, at DB-load time)
+# =============================================================================
+
+def encode_coded(items, key, code_map, other_code, default=''):
+    """Int8-code items[key] through code_map (unknown -> other_code)."""
+    n = len(items)
+    return np.fromiter(
+        (code_map.get(item.get(key, default), other_code) for item in items),
+        dtype=np.int8,
+        count=n,
+    )
+
+
+def encode_ras_events(events):
+    """Code enforcement events into (type_codes, sev_codes) int8 arrays."""
+    n = len(events)
+
+    def _type_code(event_type):
+        for token, code in RAS_TYPE_CODES.items():
+            if token in event_type:
+                return code
+        return RAS_OTHER_CODE
+
+    type_codes = np.fromiter(
+        (_type_code(e.get('type', '')) for e in events), dtype=np.int8, count=n
+    )
+    sev_codes = np.fromiter(
+        (1 if e.get('severity', 'low') == 'high' else 0 for e in events),
+        dtype=np.int8,
+        count=n,
+    )
+    return type_codes, sev_codes
+
+
+def encode_cls_shifts(shifts):
+    """Code case-law shifts into (court_codes, major_codes) int8 arrays."""
+    court_codes = encode_coded(shifts, 'court', CLS_COURT_CODES, CLS_OTHER_CODE, 'lower')
+    major_codes = np.fromiter(
+        (1 if s.get('impact', 'minor') == 'major' else 0 for s in shifts),
+        dtype=np.int8,
+        count=len(shifts),
+    )
+    return court_codes, major_codes
+
+
+# =============================================================================
+# KERNELS
+# =============================================================================
+
+def _sum_table_py(codes, table):
+    s = 0
+    for i in range(codes.shape[0]):
+        s += table[codes[i]]
+    return s
+
+
+def _sum_pair_table_py(a_codes, b_codes, table):
+    s = 0
+    for i in range(a_codes.shape[0]):
+        s += table[a_codes[i], b_codes[i]]
+    return s
+
+
+if NUMBA_AVAILABLE:
+    sum_table = njit(cache=True)(_sum_table_py)
+    sum_pair_table = njit(cache=True)(_sum_pair_table_py)
+
+    # Warm-start the JIT at import so the first real batch pays no
+    # compile latency (cached compiles make this near-free on reruns).
+    sum_table(np.zeros(1, dtype=np.int8), GPS_TABLE)
+    sum_pair_table(
+        np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8), RAS_TABLE
+    )
+else:
+    sum_table = _sum_table_py
+    sum_pair_table = _sum_pair_table_py
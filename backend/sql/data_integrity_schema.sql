@@ -334,3 +334,58 @@ $$ LANGUAGE plpgsql;
 COMMENT ON TABLE audit_log IS 'Immutable audit log per Article XI - all data modifications tracked';
 COMMENT ON TABLE decision_versions IS 'Complete version history for all tribunal decisions';
 COMMENT ON TABLE data_quality_issues IS 'Data quality check failures requiring review';
+
+-- =============================================================================
+-- QUALITY REPORT SUPPORT
+-- =============================================================================
+
+-- Server-side pre-filter for the daily quality report: returns only
+-- the columns the Python checks read, and only rows that fail at
+-- least one cheap predicate (or carry a content hash that still needs
+-- verifying), so the report re-validates and hashes a small subset
+-- instead of the whole 7-day window.
+CREATE OR REPLACE FUNCTION quality_candidates(since TIMESTAMPTZ)
+RETURNS TABLE (
+    id UUID,
+    source_identifier TEXT,
+    title TEXT,
+    full_text TEXT,
+    url TEXT,
+    published_date TIMESTAMPTZ,
+    metadata JSONB,
+    updated_at TIMESTAMPTZ
+) AS $$
+    SELECT r.id, r.source_identifier, r.title, r.full_text, r.url,
+           r.published_date, r.metadata, r.updated_at
+    FROM regulatory_updates r
+    WHERE r.created_at >= since
+      AND r.source_type = 'employment_tribunal'
+      AND (
+          r.source_identifier IS NULL OR r.source_identifier = ''
+          OR r.title IS NULL OR r.title = ''
+          OR r.full_text IS NULL OR char_length(r.full_text) < 100
+          OR r.url IS NULL OR r.url = '' OR r.url !~ '^https?://'
+          OR r.published_date > NOW()
+          OR r.metadata ? 'content_hash'
+      );
+$$ LANGUAGE sql STABLE;
+
+-- =============================================================================
+-- RECONCILIATION SUPPORT
+-- =============================================================================
+
+-- Server-side anti-join for scrape reconciliation: takes the scraped
+-- ids as one array and returns only the ones missing from
+-- regulatory_updates, in their original order. One call replaces the
+-- chunked client-side diff, only the missing ids travel back over the
+-- wire, and the set difference runs against the source_identifier
+-- index.
+CREATE OR REPLACE FUNCTION reconcile(scraped_ids TEXT[])
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(t.sid ORDER BY t.ord), '{}')
+    FROM unnest(scraped_ids) WITH ORDINALITY AS t(sid, ord)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM regulatory_updates r
+        WHERE r.source_identifier = t.sid
+    );
+$$ LANGUAGE sql STABLE;
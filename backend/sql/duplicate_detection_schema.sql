@@ -0,0 +1,298 @@
+-- =============================================================================
+-- ACEI v6.0 - Duplicate Detection & Version Tracking Support
+-- Phase 1, Week 1, Priority 1B
+-- =============================================================================
+-- Server-side helpers for backend/scrapers/duplicate_detector.py.
+-- Table definitions live in data_integrity_schema.sql.
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Every duplicate check filters on (source_type, source_identifier)
+-- equality; this composite unique index turns that from a sequential
+-- scan into an index lookup, and the INCLUDE columns make the
+-- check_duplicate select (id, metadata) an index-only scan with zero
+-- heap touches. Uniqueness also backs the upsert/merge paths.
+-- Note: CONCURRENTLY cannot run inside a transaction block — apply
+-- this statement on its own when migrating a live database.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS regulatory_updates_sid_stype_idx
+ON regulatory_updates (source_type, source_identifier)
+INCLUDE (id, metadata);
+
+-- =============================================================================
+-- LATEST VERSION LOOKUP
+-- =============================================================================
+
+-- Per-source latest version, maintained incrementally by trigger (a
+-- materialized view would need a full refresh per insert). Lookups
+-- become a primary-key read — one for the single case, one .in_() for
+-- many sources at once — instead of an ordered index traversal over
+-- decision_versions per call.
+CREATE TABLE IF NOT EXISTS latest_decision_version (
+    source_identifier TEXT PRIMARY KEY,
+    version INT NOT NULL
+);
+
+-- Backfill from existing history
+INSERT INTO latest_decision_version (source_identifier, version)
+SELECT source_identifier, MAX(version)
+FROM decision_versions
+GROUP BY source_identifier
+ON CONFLICT (source_identifier) DO UPDATE SET version = EXCLUDED.version;
+
+CREATE OR REPLACE FUNCTION bump_latest_decision_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO latest_decision_version (source_identifier, version)
+    VALUES (NEW.source_identifier, NEW.version)
+    ON CONFLICT (source_identifier) DO UPDATE
+    SET version = GREATEST(latest_decision_version.version, EXCLUDED.version);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER decision_versions_bump_latest
+    AFTER INSERT ON decision_versions
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_latest_decision_version();
+
+-- =============================================================================
+-- MERGE (single round trip)
+-- =============================================================================
+
+-- Replaces the SELECT + version INSERTs + UPDATE sequence of
+-- merge_duplicate with one transactional call: the superseded row's
+-- hash is versioned, the new version record is chained to it, and the
+-- row is updated — all server-side, so the client pays one round trip
+-- and the version chain cannot be left half-written.
+CREATE OR REPLACE FUNCTION upsert_regulatory_update(payload JSONB)
+RETURNS SETOF regulatory_updates AS $$
+DECLARE
+    v_sid TEXT := payload->>'source_identifier';
+    v_version INT := COALESCE((payload#>>'{metadata,version}')::INT, 1);
+    v_old regulatory_updates%ROWTYPE;
+    v_old_version_id UUID;
+BEGIN
+    SELECT * INTO v_old
+    FROM regulatory_updates
+    WHERE source_identifier = v_sid
+      AND source_type = 'employment_tribunal'
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Cannot merge - existing record not found: %', v_sid;
+    END IF;
+
+    -- Version record for the superseded content. It usually already
+    -- exists (written when that version first landed), and legacy
+    -- rows defaulting to version 1 have no version 0 - versions start
+    -- at 1. Backfill only what is missing and never abort the merge
+    -- over a duplicate.
+    IF v_version > 1 THEN
+        INSERT INTO decision_versions (
+            source_identifier, version, content_hash, changed_by, change_reason
+        ) VALUES (
+            v_sid,
+            v_version - 1,
+            COALESCE(v_old.metadata->>'content_hash', ''),
+            'scraper',
+            'Superseded by new version'
+        )
+        ON CONFLICT (source_identifier, version) DO NOTHING;
+
+        SELECT id INTO v_old_version_id
+        FROM decision_versions
+        WHERE source_identifier = v_sid AND version = v_version - 1;
+    END IF;
+
+    -- Version record for the new content, chained to the old one
+    INSERT INTO decision_versions (
+        source_identifier, version, content_hash, changed_by,
+        change_reason, previous_version_id
+    ) VALUES (
+        v_sid,
+        v_version,
+        COALESCE(payload#>>'{metadata,content_hash}', ''),
+        'scraper',
+        'Updated from new scrape',
+        v_old_version_id
+    )
+    ON CONFLICT (source_identifier, version) DO NOTHING;
+
+    RETURN QUERY
+    UPDATE regulatory_updates r
+    SET title = COALESCE(payload->>'title', r.title),
+        summary = COALESCE(payload->>'summary', r.summary),
+        full_text = COALESCE(payload->>'full_text', r.full_text),
+        url = COALESCE(payload->>'url', r.url),
+        published_date = COALESCE(
+            (payload->>'published_date')::TIMESTAMPTZ, r.published_date
+        ),
+        metadata = COALESCE(payload->'metadata', '{}'::jsonb)
+            || jsonb_build_object(
+                'updated_at', NOW(),
+                'version', v_version,
+                'previous_version_id', v_old_version_id
+            )
+    WHERE r.id = v_old.id
+    RETURNING r.*;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================================================
+-- FULL DECISION PROCESSING (single round trip)
+-- =============================================================================
+
+-- The whole check_duplicate -> skip/merge/insert decision tree in one
+-- transactional call. Returns {'action': 'inserted'|'updated'|
+-- 'skipped', 'version': int}; the version chain is written atomically
+-- with the row mutation, so it can never be left inconsistent by a
+-- client failure between round trips.
+CREATE OR REPLACE FUNCTION process_decision(payload JSONB, content_hash TEXT)
+RETURNS JSONB AS $$
+DECLARE
+    v_sid TEXT := payload->>'source_identifier';
+    v_old regulatory_updates%ROWTYPE;
+    v_new_version INT;
+    v_old_version_id UUID;
+BEGIN
+    SELECT * INTO v_old
+    FROM regulatory_updates
+    WHERE source_identifier = v_sid
+      AND source_type = 'employment_tribunal'
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        -- New decision: insert row + initial version record
+        INSERT INTO regulatory_updates (
+            source_type, source_identifier, title, summary, full_text,
+            url, published_date, metadata, status
+        ) VALUES (
+            COALESCE(payload->>'source_type', 'employment_tribunal'),
+            v_sid,
+            payload->>'title',
+            payload->>'summary',
+            payload->>'full_text',
+            payload->>'url',
+            (payload->>'published_date')::TIMESTAMPTZ,
+            COALESCE(payload->'metadata', '{}'::jsonb)
+                || jsonb_build_object('version', 1),
+            payload->>'status'
+        );
+
+        INSERT INTO decision_versions (
+            source_identifier, version, content_hash, changed_by, change_reason
+        ) VALUES (
+            v_sid, 1, process_decision.content_hash, 'scraper', 'Initial scrape'
+        );
+
+        RETURN jsonb_build_object('action', 'inserted', 'version', 1);
+    END IF;
+
+    -- Unchanged content: nothing to write
+    IF COALESCE(v_old.metadata->>'content_hash', '') = process_decision.content_hash THEN
+        RETURN jsonb_build_object(
+            'action', 'skipped',
+            'version', COALESCE((v_old.metadata->>'version')::INT, 1)
+        );
+    END IF;
+
+    -- Changed content: version the old row, chain the new record,
+    -- apply the update
+    v_new_version := COALESCE(
+        (v_old.metadata->>'version')::INT,
+        (SELECT COALESCE(MAX(version), 0)
+         FROM decision_versions WHERE source_identifier = v_sid)
+    ) + 1;
+
+    -- The superseded content's record normally already exists (the
+    -- insert branch wrote version 1, and every prior update wrote its
+    -- own row), so only backfill genuinely missing history - and never
+    -- abort the update over a duplicate. Versions start at 1, so
+    -- there is nothing to record below that.
+    IF v_new_version > 1 THEN
+        INSERT INTO decision_versions (
+            source_identifier, version, content_hash, changed_by, change_reason
+        ) VALUES (
+            v_sid,
+            v_new_version - 1,
+            COALESCE(v_old.metadata->>'content_hash', ''),
+            'scraper',
+            'Superseded by new version'
+        )
+        ON CONFLICT (source_identifier, version) DO NOTHING;
+
+        SELECT id INTO v_old_version_id
+        FROM decision_versions
+        WHERE source_identifier = v_sid AND version = v_new_version - 1;
+    END IF;
+
+    INSERT INTO decision_versions (
+        source_identifier, version, content_hash, changed_by,
+        change_reason, previous_version_id
+    ) VALUES (
+        v_sid, v_new_version, process_decision.content_hash, 'scraper',
+        'Updated from new scrape', v_old_version_id
+    )
+    ON CONFLICT (source_identifier, version) DO NOTHING;
+
+    UPDATE regulatory_updates r
+    SET title = COALESCE(payload->>'title', r.title),
+        summary = COALESCE(payload->>'summary', r.summary),
+        full_text = COALESCE(payload->>'full_text', r.full_text),
+        url = COALESCE(payload->>'url', r.url),
+        published_date = COALESCE(
+            (payload->>'published_date')::TIMESTAMPTZ, r.published_date
+        ),
+        metadata = COALESCE(payload->'metadata', '{}'::jsonb)
+            || jsonb_build_object(
+                'updated_at', NOW(),
+                'version', v_new_version,
+                'previous_version_id', v_old_version_id
+            )
+    WHERE r.id = v_old.id;
+
+    RETURN jsonb_build_object('action', 'updated', 'version', v_new_version);
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================================================
+-- NEW-DECISION INSERT (single round trip)
+-- =============================================================================
+
+-- Happy-path insert: row + initial version record written atomically
+-- through one data-modifying CTE, so the version record can never be
+-- lost to a client failure after the main insert. Returns the new
+-- row's id.
+CREATE OR REPLACE FUNCTION insert_decision_with_version(payload JSONB, content_hash TEXT)
+RETURNS UUID AS $$
+    WITH ins AS (
+        INSERT INTO regulatory_updates (
+            source_type, source_identifier, title, summary, full_text,
+            url, published_date, metadata, status
+        ) VALUES (
+            COALESCE(payload->>'source_type', 'employment_tribunal'),
+            payload->>'source_identifier',
+            payload->>'title',
+            payload->>'summary',
+            payload->>'full_text',
+            payload->>'url',
+            (payload->>'published_date')::TIMESTAMPTZ,
+            COALESCE(payload->'metadata', '{}'::jsonb)
+                || jsonb_build_object('version', 1),
+            payload->>'status'
+        )
+        RETURNING id, source_identifier
+    ),
+    ver AS (
+        INSERT INTO decision_versions (
+            source_identifier, version, content_hash, changed_by, change_reason
+        )
+        SELECT ins.source_identifier, 1,
+               insert_decision_with_version.content_hash,
+               'scraper', 'Initial scrape'
+        FROM ins
+    )
+    SELECT id FROM ins;
+$$ LANGUAGE sql;
@@ -0,0 +1,45 @@
+"""
+Build script for the optional ACEI Cython core.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+
+The extension is a pure accelerator; the engine runs unmodified
+without it.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+
+# OpenMP drives the prange batch kernel; only wired up where the
+# -fopenmp spelling is known good.
+_OMP = ["-fopenmp"] if sys.platform.startswith("linux") else []
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "acei_engine._acei_core",
+                ["acei_engine/_acei_core.pyx"],
+                extra_compile_args=_OMP,
+                extra_link_args=_OMP,
+            )
+        ],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    )
+
+setup(
+    name="ailane-acei-core",
+    ext_modules=ext_modules,
+)